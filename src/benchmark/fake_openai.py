@@ -0,0 +1,156 @@
+import os
+import json
+import time
+import uuid
+import base64
+import asyncio
+import hashlib
+import argparse
+import random
+from array import array
+from typing import List, Dict, Any, Union
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+
+def fake_embedding(
+    text: str,
+    dim: int
+) -> List[float]:
+    """
+    Create a deterministic pseudo-embedding, so a document and an identical query map to the same vector.
+    Args:
+        text (str): Input text.
+        dim (int): Embedding size.
+    Returns:
+        List[float]: Embedding.
+    """
+    seed = int(hashlib.md5(text.encode("utf-8")).hexdigest(), 16)
+    rng = random.Random(seed)
+    return [rng.uniform(-1, 1) for _ in range(dim)]
+
+
+def create_app(
+    ttft: float = 0.3,
+    token_latency: float = 0.02,
+    tokens: int = 200,
+    embedding_dim: int = 1536,
+    embedding_latency: float = 0.05
+) -> FastAPI:
+    """
+    Create a stand-in for the OpenAI chat completions and embeddings endpoints.
+    Args:
+        ttft (float): Seconds before the first streamed token.
+        token_latency (float): Seconds between streamed tokens.
+        tokens (int): Number of tokens in every completion.
+        embedding_dim (int): Size of the returned embeddings.
+        embedding_latency (float): Seconds taken by every embeddings request.
+    Returns:
+        FastAPI: The fake OpenAI app, mounted under /v1.
+    """
+    app = FastAPI()
+
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request) -> Dict[str, Any]:
+        body = await request.json()
+        inputs: Union[str, List[str]] = body["input"]
+        if isinstance(inputs, str):
+            inputs = [inputs]
+
+        await asyncio.sleep(embedding_latency)
+
+        data = []
+        for i, text in enumerate(inputs):
+            embedding = fake_embedding(text, embedding_dim)
+            if body.get("encoding_format") == "base64":
+                embedding = base64.b64encode(array("f", embedding).tobytes()).decode("ascii")
+            data.append({"object": "embedding", "index": i, "embedding": embedding})
+
+        return {
+            "object": "list",
+            "data": data,
+            "model": body.get("model", ""),
+            "usage": {"prompt_tokens": 0, "total_tokens": 0}
+        }
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+        model = body.get("model", "")
+
+        def chunk(delta: Dict[str, Any], finish_reason: Union[str, None] = None) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+            }
+            return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+        if not body.get("stream"):
+            await asyncio.sleep(ttft + token_latency * (tokens - 1))
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "token " * tokens},
+                    "finish_reason": "stop"
+                }],
+                "usage": {"prompt_tokens": 0, "completion_tokens": tokens, "total_tokens": tokens}
+            }
+
+        async def stream():
+            yield chunk({"role": "assistant", "content": ""})
+            await asyncio.sleep(ttft)
+            for i in range(tokens):
+                if i:
+                    await asyncio.sleep(token_latency)
+                yield chunk({"content": "token "})
+            yield chunk({}, finish_reason="stop")
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    return app
+
+
+def app_from_env() -> FastAPI:
+    """
+    Create the fake OpenAI app from FAKE_OPENAI_* environment variables,
+    for `uvicorn fake_openai:app_from_env --factory`.
+    Returns:
+        FastAPI: The fake OpenAI app.
+    """
+    return create_app(
+        ttft=float(os.getenv("FAKE_OPENAI_TTFT", "0.3")),
+        token_latency=float(os.getenv("FAKE_OPENAI_TOKEN_LATENCY", "0.02")),
+        tokens=int(os.getenv("FAKE_OPENAI_TOKENS", "200")),
+        embedding_dim=int(os.getenv("FAKE_OPENAI_EMBEDDING_DIM", "1536")),
+        embedding_latency=float(os.getenv("FAKE_OPENAI_EMBEDDING_LATENCY", "0.05"))
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake OpenAI server streaming tokens with configurable latency.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--ttft", type=float, default=0.3, help="Seconds before the first token")
+    parser.add_argument("--token-latency", type=float, default=0.02, help="Seconds between tokens")
+    parser.add_argument("--tokens", type=int, default=200, help="Tokens per completion")
+    parser.add_argument("--embedding-dim", type=int, default=1536)
+    parser.add_argument("--embedding-latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    uvicorn.run(
+        create_app(args.ttft, args.token_latency, args.tokens, args.embedding_dim, args.embedding_latency),
+        host=args.host,
+        port=args.port,
+        log_level="warning"
+    )
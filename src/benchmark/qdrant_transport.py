@@ -0,0 +1,124 @@
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+from typing import List, Dict, Any
+from loguru import logger
+from qdrant_client import models
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lawbot"))
+from clients import get_qdrant_client
+from stats import percentile
+
+
+def build_prefetch(
+    dense_dim: int = 1536,
+    colbert_dim: int = 128,
+    colbert_tokens: int = 32,
+    sparse_terms: int = 12
+) -> List[models.Prefetch]:
+    """
+    Build the three-prefetch payload used by HybridSearch.query with random vectors.
+    Random vectors keep the payload shape identical without calling the embedding models.
+    Args:
+        dense_dim (int): Size of the OpenAI dense embedding.
+        colbert_dim (int): Size of each ColBERT token vector.
+        colbert_tokens (int): Number of ColBERT query token vectors.
+        sparse_terms (int): Number of non-zero BM25 terms.
+    Returns:
+        List[models.Prefetch]: Prefetch queries for the RRF fusion query.
+    """
+    dense = [random.uniform(-1, 1) for _ in range(dense_dim)]
+    late_interaction = [
+        [random.uniform(-1, 1) for _ in range(colbert_dim)]
+        for _ in range(colbert_tokens)
+    ]
+    sparse = models.SparseVector(
+        indices=random.sample(range(1, 2 ** 31), sparse_terms),
+        values=[random.uniform(0, 2) for _ in range(sparse_terms)]
+    )
+
+    return [
+        models.Prefetch(query=dense, using="openai-embedding", limit=10),
+        models.Prefetch(query=sparse, using="bm25", limit=10),
+        models.Prefetch(query=late_interaction, using="late_interaction", limit=10),
+    ]
+
+
+def run_transport(
+    qdrant_url: str,
+    collection_name: str,
+    prefer_grpc: bool,
+    iterations: int,
+    warmup: int,
+    payloads: List[List[models.Prefetch]]
+) -> Dict[str, Any]:
+    """
+    Time the RRF query over one transport.
+    Args:
+        qdrant_url (str): Qdrant REST URL.
+        collection_name (str): Collection to query.
+        prefer_grpc (bool): Use gRPC instead of REST.
+        iterations (int): Number of timed queries.
+        warmup (int): Number of untimed queries sent first.
+        payloads (List[List[models.Prefetch]]): Prefetch payloads cycled through.
+    Returns:
+        Dict[str, Any]: Wall-clock latency and client CPU statistics in milliseconds.
+    """
+    client = get_qdrant_client(url=qdrant_url, prefer_grpc=prefer_grpc)
+
+    def query(prefetch: List[models.Prefetch]) -> None:
+        client.query_points(
+            collection_name=collection_name,
+            prefetch=prefetch,
+            query=models.FusionQuery(fusion=models.Fusion.RRF),
+            with_payload=True,
+            limit=5,
+        )
+
+    for i in range(warmup):
+        query(payloads[i % len(payloads)])
+
+    latencies, cpu_times = [], []
+    for i in range(iterations):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        query(payloads[i % len(payloads)])
+        cpu_times.append((time.process_time() - cpu_start) * 1000)
+        latencies.append((time.perf_counter() - wall_start) * 1000)
+
+    return {
+        "transport": "grpc" if prefer_grpc else "rest",
+        "mean_ms": statistics.mean(latencies),
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "cpu_ms": statistics.mean(cpu_times),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare Qdrant REST and gRPC latency for the hybrid RRF query.")
+    parser.add_argument("--qdrant-url", default="http://localhost:6333")
+    parser.add_argument("--collection", default="legal_documents")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--colbert-tokens", type=int, default=32)
+    args = parser.parse_args()
+
+    payloads = [build_prefetch(colbert_tokens=args.colbert_tokens) for _ in range(16)]
+
+    results = [
+        run_transport(args.qdrant_url, args.collection, prefer_grpc, args.iterations, args.warmup, payloads)
+        for prefer_grpc in (False, True)
+    ]
+
+    print(f"{'transport':<10}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'cpu':>10}")
+    for result in results:
+        print(
+            f"{result['transport']:<10}"
+            f"{result['mean_ms']:>10.2f}{result['p50_ms']:>10.2f}"
+            f"{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}{result['cpu_ms']:>10.2f}"
+        )
+    logger.info("Latency and client CPU are reported in milliseconds per query")
@@ -0,0 +1,299 @@
+import os
+import sys
+import json
+import time
+import random
+import signal
+import asyncio
+import argparse
+import subprocess
+from typing import List, Dict, Any, Optional, Tuple
+import httpx
+from loguru import logger
+
+from stats import percentile
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+LAWBOT_DIR = os.path.join(BENCHMARK_DIR, "..", "lawbot")
+
+
+def load_queries(
+    log_path: str
+) -> List[str]:
+    """
+    Load queries from a JSONL query log.
+    Args:
+        log_path (str): Path to a JSONL file with one {"query": ...} object per line.
+    Returns:
+        List[str]: Queries in log order.
+    """
+    queries = []
+    with open(log_path, "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                queries.append(json.loads(line)["query"])
+    logger.info(f"Loaded {len(queries)} queries from {log_path}")
+    return queries
+
+
+async def send_query(
+    client: httpx.AsyncClient,
+    query: str,
+    arrival: float
+) -> Dict[str, Any]:
+    """
+    Send one streaming /chat request.
+    Args:
+        client (httpx.AsyncClient): Client bound to the chat service.
+        query (str): User query.
+        arrival (float): perf_counter time the request was scheduled, latency is measured from it.
+    Returns:
+        Dict[str, Any]: ok flag, time to first token, latency (seconds) and streamed characters.
+    """
+    ttft = None
+    chars = 0
+    try:
+        async with client.stream("POST", "/chat", params={"query": query, "stream": "true"}) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_text():
+                if chunk and ttft is None:
+                    ttft = time.perf_counter() - arrival
+                chars += len(chunk)
+    except Exception as e:
+        logger.error(f"Request failed: {e!r}")
+        return {"ok": False, "ttft": ttft, "latency": time.perf_counter() - arrival, "chars": chars}
+
+    return {"ok": True, "ttft": ttft, "latency": time.perf_counter() - arrival, "chars": chars}
+
+
+async def run_load(
+    target: str,
+    queries: List[str],
+    num_requests: int,
+    concurrency: int,
+    rate: Optional[float] = None,
+    timeout: float = 120.0
+) -> Tuple[List[Dict[str, Any]], float]:
+    """
+    Replay queries against /chat.
+    Without a rate, `concurrency` requests are kept in flight (closed loop). With a
+    rate, requests arrive as a Poisson process (open loop) and latency includes the
+    time spent waiting for a free concurrency slot.
+    Args:
+        target (str): Base URL of the chat service.
+        queries (List[str]): Queries, cycled when num_requests exceeds the log.
+        num_requests (int): Total number of requests.
+        concurrency (int): Maximum requests in flight.
+        rate (Optional[float]): Mean arrival rate in requests per second.
+        timeout (float): Per-request timeout in seconds.
+    Returns:
+        Tuple[List[Dict[str, Any]], float]: Per-request results and wall-clock duration.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    results = []
+
+    async with httpx.AsyncClient(
+        base_url=target,
+        timeout=timeout,
+        limits=httpx.Limits(max_connections=concurrency)
+    ) as client:
+
+        async def worker(query: str) -> None:
+            arrival = time.perf_counter()
+            async with semaphore:
+                if rate is None:
+                    arrival = time.perf_counter()
+                results.append(await send_query(client, query, arrival))
+
+        start = time.perf_counter()
+        tasks = []
+        for i in range(num_requests):
+            if rate and i:
+                await asyncio.sleep(random.expovariate(rate))
+            tasks.append(asyncio.create_task(worker(queries[i % len(queries)])))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - start
+
+    return results, elapsed
+
+
+def summarize(
+    results: List[Dict[str, Any]],
+    elapsed: float
+) -> Dict[str, Any]:
+    """
+    Aggregate per-request results.
+    Args:
+        results (List[Dict[str, Any]]): Output of run_load.
+        elapsed (float): Wall-clock duration of the run in seconds.
+    Returns:
+        Dict[str, Any]: Throughput, error count and TTFT / latency percentiles in milliseconds.
+    """
+    ok = [result for result in results if result["ok"]]
+    ttfts = [result["ttft"] * 1000 for result in ok if result["ttft"] is not None]
+    latencies = [result["latency"] * 1000 for result in ok]
+
+    summary = {
+        "requests": len(results),
+        "errors": len(results) - len(ok),
+        "duration_s": elapsed,
+        "throughput_rps": len(ok) / elapsed if elapsed else 0.0,
+        "chars_per_s": sum(result["chars"] for result in ok) / elapsed if elapsed else 0.0,
+    }
+    for name, values in (("ttft_ms", ttfts), ("latency_ms", latencies)):
+        for q in (50, 90, 95, 99):
+            summary[f"{name}_p{q}"] = percentile(values, q)
+        summary[f"{name}_max"] = max(values) if values else 0.0
+    return summary
+
+
+def start_server(
+    app: str,
+    app_dir: str,
+    port: int,
+    env: Dict[str, str],
+    ready_path: str = "/",
+    factory: bool = False,
+    startup_timeout: float = 600.0
+) -> subprocess.Popen:
+    """
+    Run an ASGI app in a uvicorn subprocess and wait until it answers HTTP requests.
+    Keeping the servers out of the load generator's interpreter avoids measuring
+    GIL contention between the client and the service.
+    Args:
+        app (str): uvicorn app reference, e.g. "chat_api:app".
+        app_dir (str): Directory the app module is imported from.
+        port (int): Port to bind on 127.0.0.1.
+        env (Dict[str, str]): Environment of the subprocess.
+        ready_path (str): Path polled until the server responds.
+        factory (bool): `app` is a factory function returning the app.
+        startup_timeout (float): Seconds to wait for the server, model downloads included.
+    Returns:
+        subprocess.Popen: The server process.
+    """
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", app,
+            "--app-dir", app_dir,
+            "--host", "127.0.0.1",
+            "--port", str(port),
+            "--log-level", "warning"
+        ] + (["--factory"] if factory else []),
+        env=env
+    )
+    deadline = time.monotonic() + startup_timeout
+    while True:
+        if process.poll() is not None:
+            raise RuntimeError(f"{app} exited with code {process.returncode} during startup")
+        try:
+            httpx.get(f"http://127.0.0.1:{port}{ready_path}", timeout=1.0)
+            return process
+        except httpx.TransportError:
+            if time.monotonic() > deadline:
+                stop_server(process)
+                raise RuntimeError(f"{app} did not start within {startup_timeout:.0f}s")
+            time.sleep(0.2)
+
+
+def stop_server(
+    process: subprocess.Popen
+) -> None:
+    """
+    Stop a server started by start_server, letting it run its shutdown hooks.
+    Args:
+        process (subprocess.Popen): The server process.
+    """
+    if process.poll() is not None:
+        return
+    process.send_signal(signal.SIGINT)
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a JSONL query log against /chat and report latency.")
+    parser.add_argument("--log", default=os.path.join(BENCHMARK_DIR, "queries.jsonl"), help="JSONL query log")
+    parser.add_argument("--requests", type=int, default=None, help="Number of requests (default: one per query)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=None, help="Mean arrival rate (req/s); closed loop when unset")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--target", default=None, help="Running chat service URL; chat_api:app is started locally when unset")
+    parser.add_argument("--port", type=int, default=30000, help="Port of the local chat service")
+    parser.add_argument("--fake-openai", action="store_true", help="Start the fake OpenAI server and point the service at it")
+    parser.add_argument("--fake-openai-port", type=int, default=8001)
+    parser.add_argument("--ttft", type=float, default=0.3, help="Fake OpenAI seconds before the first token")
+    parser.add_argument("--token-latency", type=float, default=0.02, help="Fake OpenAI seconds between tokens")
+    parser.add_argument("--tokens", type=int, default=200, help="Fake OpenAI tokens per completion")
+    parser.add_argument("--qdrant-url", default=":memory:", help="Qdrant for the local service: URL or :memory:")
+    parser.add_argument("--qdrant-path", default=None, help="Use an on-disk embedded Qdrant in this directory instead")
+    parser.add_argument("--seed", default=None, help="processed_documents.json used to seed Qdrant")
+    parser.add_argument("--seed-limit", type=int, default=None, help="Only seed the first N documents")
+    parser.add_argument("--profile", default=None, help="Write folded stacks of ChatService.chat to this file")
+    parser.add_argument("--output", default=None, help="Write the summary as JSON to this file")
+    args = parser.parse_args()
+
+    queries = load_queries(args.log)
+    servers = []
+    target = args.target
+    env = dict(os.environ)
+
+    try:
+        if args.fake_openai:
+            fake_env = dict(
+                env,
+                FAKE_OPENAI_TTFT=str(args.ttft),
+                FAKE_OPENAI_TOKEN_LATENCY=str(args.token_latency),
+                FAKE_OPENAI_TOKENS=str(args.tokens)
+            )
+            servers.append(start_server("fake_openai:app_from_env", BENCHMARK_DIR, args.fake_openai_port, fake_env, factory=True))
+            env["OPENAI_BASE_URL"] = f"http://127.0.0.1:{args.fake_openai_port}/v1"
+            env.setdefault("OPENAI_API_KEY", "fake")
+            logger.info(f"Fake OpenAI server listening on {env['OPENAI_BASE_URL']}")
+
+        if target is None:
+            env["QDRANT_URL"] = args.qdrant_url
+            if args.qdrant_path:
+                env["QDRANT_PATH"] = os.path.abspath(args.qdrant_path)
+            if args.profile:
+                env["PROFILE_OUTPUT"] = os.path.abspath(args.profile)
+
+            if args.seed:
+                # Seed inside the service process so an in-memory Qdrant is shared with it
+                env["SEED_DOCUMENTS"] = os.path.abspath(args.seed)
+                if args.seed_limit:
+                    env["SEED_LIMIT"] = str(args.seed_limit)
+                app, app_dir = "seeded_app:app", BENCHMARK_DIR
+            else:
+                app, app_dir = "chat_api:app", LAWBOT_DIR
+
+            servers.append(start_server(app, app_dir, args.port, env, ready_path="/health"))
+            target = f"http://127.0.0.1:{args.port}"
+            logger.info(f"Chat service listening on {target}")
+        elif args.profile:
+            logger.warning("--profile only applies to the local service; set PROFILE_OUTPUT on the target instead")
+
+        results, elapsed = asyncio.run(run_load(
+            target=target,
+            queries=queries,
+            num_requests=args.requests or len(queries),
+            concurrency=args.concurrency,
+            rate=args.rate,
+            timeout=args.timeout
+        ))
+    finally:
+        # Stopping the chat service runs its shutdown hook, which writes the profile
+        for server in reversed(servers):
+            stop_server(server)
+
+    summary = summarize(results, elapsed)
+    for key, value in summary.items():
+        print(f"{key:<20}{value:>12.2f}" if isinstance(value, float) else f"{key:<20}{value:>12}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=4)
+        logger.info(f"Summary written to {args.output}")
@@ -0,0 +1,57 @@
+import os
+import sys
+from typing import Optional
+from loguru import logger
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BENCHMARK_DIR, "..", "lawbot"))
+sys.path.append(os.path.join(BENCHMARK_DIR, "..", "vectordb"))
+
+# Refuse to seed the in-cluster Qdrant that chat_api falls back to
+if os.getenv("SEED_DOCUMENTS") and not (os.getenv("QDRANT_URL") or os.getenv("QDRANT_PATH")):
+    raise RuntimeError("SEED_DOCUMENTS requires QDRANT_URL or QDRANT_PATH")
+
+from chat_api import DEFAULT_QDRANT_URL, app
+
+
+def seed_qdrant(
+    qdrant_url: str,
+    document_path: str,
+    limit: Optional[int] = None
+) -> None:
+    """
+    Create and fill the legal_documents collection from processed_documents.json.
+    Runs inside the chat service process, so an in-memory Qdrant is shared with
+    the service through the client factory.
+    Args:
+        qdrant_url (str): Qdrant URL or ":memory:".
+        document_path (str): Path to processed_documents.json.
+        limit (Optional[int]): Only upload the first `limit` documents.
+    """
+    # upload_qdrant overwrites OPENAI_API_KEY on import
+    api_key = os.environ.get("OPENAI_API_KEY")
+    from upload_qdrant import QdrantUploader
+    if api_key is not None:
+        os.environ["OPENAI_API_KEY"] = api_key
+
+    uploader = QdrantUploader(
+        qdrant_url=qdrant_url,
+        collection_name="legal_documents",
+        document_path=document_path
+    )
+    if limit:
+        uploader.documents = uploader.documents[:limit]
+    if not uploader.qdrant_client.collection_exists("legal_documents"):
+        uploader.create_client()
+    uploader.upload_documents()
+    logger.info(f"Seeded Qdrant with {len(uploader.documents)} documents from {document_path}")
+
+
+# `uvicorn seeded_app:app` serves chat_api:app after seeding Qdrant from SEED_DOCUMENTS
+if os.getenv("SEED_DOCUMENTS"):
+    seed_qdrant(
+        # Same URL as chat_api, so both share one client from the factory
+        qdrant_url=os.getenv("QDRANT_URL", DEFAULT_QDRANT_URL),
+        document_path=os.environ["SEED_DOCUMENTS"],
+        limit=int(os.environ["SEED_LIMIT"]) if os.getenv("SEED_LIMIT") else None
+    )
@@ -0,0 +1,20 @@
+import math
+from typing import List
+
+
+def percentile(
+    values: List[float],
+    q: float
+) -> float:
+    """
+    Nearest-rank percentile, shared by the benchmarks so they report comparable numbers.
+    Args:
+        values (List[float]): Samples.
+        q (float): Percentile in [0, 100].
+    Returns:
+        float: The smallest sample with at least q% of the samples at or below it, or 0.0 when there are no samples.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))]
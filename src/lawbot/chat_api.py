@@ -1,4 +1,5 @@
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.responses import StreamingResponse
 from typing import Generator, List, Dict, Any
@@ -12,11 +13,14 @@ from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.trace import get_tracer_provider, set_tracer_provider
 
 from chat_service import ChatService
+from profiler import StackSampler
 
 
 
 os.environ["OPENAI_API_KEY"] = os.getenv("OPENAI_API_KEY")
 
+DEFAULT_QDRANT_URL = "http://qdrant.vectordb.svc.cluster.local:6333"
+
 set_tracer_provider(
     TracerProvider(resource=Resource.create({SERVICE_NAME: "chat-service"}))
 )
@@ -31,14 +35,32 @@ get_tracer_provider().add_span_processor(span_processor)
 
 
 
-app = FastAPI()
+# Optional sampling profiler of the ChatService.chat hot path, enabled with PROFILE_OUTPUT
+profiler = None
+if os.getenv("PROFILE_OUTPUT"):
+    profiler = StackSampler(
+        output_path=os.getenv("PROFILE_OUTPUT"),
+        interval=float(os.getenv("PROFILE_INTERVAL", "0.005"))
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if profiler is not None:
+        profiler.start()
+    yield
+    if profiler is not None:
+        profiler.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 chat_service = ChatService(
     model="gpt-4o",
     embedding_model="text-embedding-3-small",
     sparse_model="Qdrant/bm25",
     late_interaction_model="colbert-ir/colbertv2.0",
     collection_name="legal_documents",
-    qdrant_url="http://qdrant.vectordb.svc.cluster.local:6333"
+    qdrant_url=os.getenv("QDRANT_URL", DEFAULT_QDRANT_URL)
 )
 
 @app.get("/health")
@@ -1,9 +1,9 @@
 import os
 import time
-from openai import OpenAI
-from typing import List, Dict, Any, Generator
+from typing import List, Dict, Any, Generator, Optional
 from loguru import logger
 
+from clients import get_openai_client
 from hybrid_search import HybridSearch
 from prompt import system_prompt
 
@@ -20,22 +20,28 @@ class ChatService:
         sparse_model: str = "Qdrant/bm25",
         late_interaction_model: str = "colbert-ir/colbertv2.0",
         collection_name: str = "legal_documents",
-        qdrant_url: str = "http://qdrant.vectordb.svc.cluster.local:6333"
+        qdrant_url: str = "http://qdrant.vectordb.svc.cluster.local:6333",
+        prefer_grpc: Optional[bool] = None,
+        local_index_dir: Optional[str] = None
     ) -> None:
         """
         Initialize the ChatService with OpenAI API key and model.
         Args:
             api_key (str): OpenAI API key.
             model (str): Model to use for chat completions.
+            prefer_grpc (Optional[bool]): Talk to Qdrant over gRPC; defaults to QDRANT_PREFER_GRPC.
+            local_index_dir (Optional[str]): Local BM25 fallback index; defaults to LOCAL_INDEX_DIR.
         """
-        self.client = OpenAI()
+        self.client = get_openai_client()
         self.model = model
         self.hybrid_searcher = HybridSearch(
             embedding_model=embedding_model,
             sparse_model=sparse_model,
             late_interaction_model=late_interaction_model,
             collection_name=collection_name,
-            qdrant_url=qdrant_url
+            qdrant_url=qdrant_url,
+            prefer_grpc=prefer_grpc,
+            local_index_dir=local_index_dir
         )
 
     def chat(
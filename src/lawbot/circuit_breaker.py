@@ -0,0 +1,150 @@
+import time
+import threading
+from collections import deque
+from typing import Optional
+from loguru import logger
+
+
+class CircuitBreaker:
+    """
+    A sliding-window circuit breaker.
+
+    The breaker opens when, over the last `window_size` calls, the error rate or
+    the mean latency crosses its threshold. While open, callers should use their
+    fallback. After `reset_timeout` seconds a single trial call is let through
+    (half-open); only its outcome closes or re-opens the breaker, results of
+    calls started earlier are ignored.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    # Token of calls admitted while closed, trial calls get increasing positive ids
+    NORMAL = 0
+
+    def __init__(
+        self,
+        name: str = "qdrant",
+        window_size: int = 20,
+        min_calls: int = 5,
+        error_rate_threshold: float = 0.5,
+        latency_threshold: float = 2.0,
+        reset_timeout: float = 30.0
+    ) -> None:
+        """
+        Initialize the circuit breaker.
+        Args:
+            name (str): Name used in log messages.
+            window_size (int): Number of recent calls considered.
+            min_calls (int): Calls required in the window before the breaker can open.
+            error_rate_threshold (float): Error rate (0-1) that opens the breaker.
+            latency_threshold (float): Mean latency in seconds that opens the breaker.
+            reset_timeout (float): Seconds to stay open before a trial call.
+        """
+        self.name = name
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate_threshold
+        self.latency_threshold = latency_threshold
+        self.reset_timeout = reset_timeout
+
+        self._calls = deque(maxlen=window_size)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_count = 0
+        self._trial_token: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow_request(self) -> Optional[int]:
+        """
+        Check whether the protected call should be attempted.
+        Returns:
+            Optional[int]: None when the caller should use its fallback, otherwise a
+                token to pass back to record_success / record_failure. The token is
+                NORMAL for regular calls and identifies the trial call while half-open.
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return self.NORMAL
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                self._trial_token = None
+                logger.info(f"Circuit breaker '{self.name}' half-open, sending a trial request")
+            if self._state == self.HALF_OPEN and self._trial_token is None:
+                self._trial_count += 1
+                self._trial_token = self._trial_count
+                return self._trial_token
+            return None
+
+    def record_success(self, latency: float, token: int = NORMAL) -> None:
+        """
+        Record a successful call.
+        Args:
+            latency (float): Call duration in seconds.
+            token (int): Token returned by allow_request for this call.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                if token != self._trial_token:
+                    return
+                if latency < self.latency_threshold:
+                    self._close()
+                else:
+                    self._open(f"trial request took {latency:.2f}s")
+                return
+            if self._state == self.CLOSED:
+                self._calls.append((latency, True))
+                self._evaluate()
+
+    def record_failure(self, latency: float = 0.0, token: int = NORMAL) -> None:
+        """
+        Record a failed call.
+        Args:
+            latency (float): Call duration in seconds.
+            token (int): Token returned by allow_request for this call.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                if token == self._trial_token:
+                    self._open("trial request failed")
+                return
+            if self._state == self.CLOSED:
+                self._calls.append((latency, False))
+                self._evaluate()
+
+    def release(self, token: int) -> None:
+        """
+        Give up a call without an outcome, e.g. when the request failed before reaching
+        the protected service, so a pending trial slot is freed for the next caller.
+        Args:
+            token (int): Token returned by allow_request for this call.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN and token == self._trial_token:
+                self._trial_token = None
+
+    def _evaluate(self) -> None:
+        if len(self._calls) < self.min_calls:
+            return
+        error_rate = sum(1 for _, ok in self._calls if not ok) / len(self._calls)
+        mean_latency = sum(latency for latency, _ in self._calls) / len(self._calls)
+        if error_rate >= self.error_rate_threshold:
+            self._open(f"error rate {error_rate:.0%}")
+        elif mean_latency >= self.latency_threshold:
+            self._open(f"mean latency {mean_latency:.2f}s")
+
+    def _open(self, reason: str) -> None:
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._trial_token = None
+        logger.warning(f"Circuit breaker '{self.name}' opened: {reason}")
+
+    def _close(self) -> None:
+        self._state = self.CLOSED
+        self._calls.clear()
+        self._trial_token = None
+        logger.info(f"Circuit breaker '{self.name}' closed")
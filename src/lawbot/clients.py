@@ -0,0 +1,161 @@
+import os
+from functools import lru_cache
+from typing import Optional
+import httpx
+import openai
+from loguru import logger
+from qdrant_client import QdrantClient
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """
+    Read a boolean flag from the environment.
+    Args:
+        name (str): Environment variable name.
+        default (bool): Value used when the variable is unset.
+    Returns:
+        bool: Parsed flag.
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@lru_cache(maxsize=None)
+def _build_qdrant_client(
+    url: str,
+    path: Optional[str],
+    prefer_grpc: bool,
+    grpc_port: int,
+    pool_size: int,
+    grpc_keepalive_ms: int,
+    keepalive_expiry: float,
+    timeout: int
+) -> QdrantClient:
+    # Embedded Qdrant, used by the load-replay stand-ins
+    if path:
+        logger.info(f"Creating local Qdrant client at {path}")
+        return QdrantClient(path=path)
+    if url == ":memory:":
+        logger.info("Creating in-memory Qdrant client")
+        return QdrantClient(location=url)
+
+    if prefer_grpc:
+        logger.info(f"Creating Qdrant gRPC client for {url} (grpc_port={grpc_port})")
+        return QdrantClient(
+            url=url,
+            prefer_grpc=True,
+            grpc_port=grpc_port,
+            timeout=timeout,
+            grpc_options={
+                "grpc.keepalive_time_ms": grpc_keepalive_ms,
+                "grpc.keepalive_permit_without_calls": 1,
+                "grpc.max_receive_message_length": 64 * 1024 * 1024,
+            }
+        )
+
+    logger.info(f"Creating Qdrant REST client for {url} (pool_size={pool_size})")
+    return QdrantClient(
+        url=url,
+        timeout=timeout,
+        limits=httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=keepalive_expiry
+        )
+    )
+
+
+def get_qdrant_client(
+    url: str,
+    path: Optional[str] = None,
+    prefer_grpc: Optional[bool] = None,
+    grpc_port: Optional[int] = None,
+    pool_size: Optional[int] = None,
+    grpc_keepalive_ms: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    timeout: Optional[int] = None
+) -> QdrantClient:
+    """
+    Return the process-wide Qdrant client for the given settings.
+    Unset arguments fall back to the QDRANT_* environment variables, so the
+    chat service and the uploader share one client per configuration.
+    Args:
+        url (str): Qdrant REST URL, e.g. http://qdrant:6333, or ":memory:" for an in-memory embedded Qdrant.
+        path (Optional[str]): Directory of an on-disk embedded Qdrant; overrides url. Defaults to QDRANT_PATH.
+        prefer_grpc (Optional[bool]): Use the gRPC transport instead of REST.
+        grpc_port (Optional[int]): Qdrant gRPC port.
+        pool_size (Optional[int]): Max REST connections kept in the pool; unused over gRPC,
+            which multiplexes requests on a single HTTP/2 channel.
+        grpc_keepalive_ms (Optional[int]): gRPC keep-alive ping interval in milliseconds.
+        keepalive_expiry (Optional[float]): REST idle connection expiry in seconds.
+        timeout (Optional[int]): Request timeout in seconds.
+    Returns:
+        QdrantClient: Shared Qdrant client.
+    """
+    return _build_qdrant_client(
+        url=url,
+        path=os.getenv("QDRANT_PATH") if path is None else path,
+        prefer_grpc=_env_bool("QDRANT_PREFER_GRPC", False) if prefer_grpc is None else prefer_grpc,
+        grpc_port=int(os.getenv("QDRANT_GRPC_PORT", "6334")) if grpc_port is None else grpc_port,
+        pool_size=int(os.getenv("QDRANT_POOL_SIZE", "20")) if pool_size is None else pool_size,
+        grpc_keepalive_ms=int(os.getenv("QDRANT_GRPC_KEEPALIVE_MS", "30000")) if grpc_keepalive_ms is None else grpc_keepalive_ms,
+        keepalive_expiry=float(os.getenv("QDRANT_KEEPALIVE_EXPIRY", "30")) if keepalive_expiry is None else keepalive_expiry,
+        timeout=int(os.getenv("QDRANT_TIMEOUT", "10")) if timeout is None else timeout
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_openai_client(
+    max_connections: int,
+    max_keepalive_connections: int,
+    keepalive_expiry: float,
+    http2: bool,
+    timeout: float
+) -> openai.OpenAI:
+    logger.info(
+        f"Creating OpenAI client (max_connections={max_connections}, http2={http2})"
+    )
+    # DefaultHttpxClient keeps the SDK defaults (follow_redirects) that a plain httpx.Client drops
+    http_client = openai.DefaultHttpxClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        ),
+        timeout=httpx.Timeout(timeout, connect=openai.DEFAULT_TIMEOUT.connect)
+    )
+    return openai.OpenAI(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        http_client=http_client
+    )
+
+
+def get_openai_client(
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    http2: Optional[bool] = None,
+    timeout: Optional[float] = None
+) -> openai.OpenAI:
+    """
+    Return the process-wide OpenAI client backed by a pooled httpx client.
+    Unset arguments fall back to the OPENAI_* environment variables.
+    Args:
+        max_connections (Optional[int]): Max open connections to the API.
+        max_keepalive_connections (Optional[int]): Idle connections kept alive.
+        keepalive_expiry (Optional[float]): Idle connection expiry in seconds.
+        http2 (Optional[bool]): Negotiate HTTP/2 with the API.
+        timeout (Optional[float]): Read/write timeout in seconds; the connect timeout keeps the SDK default.
+    Returns:
+        openai.OpenAI: Shared OpenAI client.
+    """
+    return _build_openai_client(
+        max_connections=int(os.getenv("OPENAI_MAX_CONNECTIONS", "50")) if max_connections is None else max_connections,
+        max_keepalive_connections=int(os.getenv("OPENAI_MAX_KEEPALIVE", "20")) if max_keepalive_connections is None else max_keepalive_connections,
+        keepalive_expiry=float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "60")) if keepalive_expiry is None else keepalive_expiry,
+        http2=_env_bool("OPENAI_HTTP2", True) if http2 is None else http2,
+        timeout=float(os.getenv("OPENAI_TIMEOUT", "60")) if timeout is None else timeout
+    )
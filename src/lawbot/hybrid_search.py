@@ -1,11 +1,15 @@
 import os
-from typing import List, Dict, Any, Generator
+import time
+from typing import List, Dict, Any, Generator, Optional
 from loguru import logger
-import openai
-from qdrant_client import QdrantClient, models
+from qdrant_client import models
 from fastembed.sparse.bm25 import Bm25
 from fastembed.late_interaction import LateInteractionTextEmbedding
 
+from circuit_breaker import CircuitBreaker
+from clients import get_openai_client, get_qdrant_client
+from local_index import LocalBM25Index
+
 
 os.environ["OPENAI_API_KEY"] = os.getenv("OPENAI_API_KEY")
 
@@ -18,7 +22,9 @@ class HybridSearch:
         late_interaction_model: str = "colbert-ir/colbertv2.0",
         collection_name: str = "legal_documents",
         qdrant_url: str = "http://qdrant.vectordb.svc.cluster.local:6333",
-        threshold: float = 0.3
+        threshold: float = 0.3,
+        prefer_grpc: Optional[bool] = None,
+        local_index_dir: Optional[str] = None
     ) -> None:
         """
         Initialize the HybridSearch class with models.
@@ -26,12 +32,12 @@ class HybridSearch:
             embedding_model (str): Name of the OpenAI embedding model.
             sparse_model (str): Name of the sparse model for BM25.
             late_interaction_model (str): Name of the late interaction model.
+            prefer_grpc (Optional[bool]): Talk to Qdrant over gRPC; defaults to QDRANT_PREFER_GRPC.
+            local_index_dir (Optional[str]): Local BM25 index used when Qdrant is unavailable; defaults to LOCAL_INDEX_DIR.
         """
 
         # OpenAI Embedding Configs
-        self.dense_embedding_model = openai.Client(
-            api_key=os.getenv("OPENAI_API_KEY"),
-        )
+        self.dense_embedding_model = get_openai_client()
         self.embedding_model = embedding_model
 
         # Sparse and Late Interaction Embedding Configs
@@ -45,23 +51,93 @@ class HybridSearch:
         )
 
         # Initialize Qdrant client
-        self.qdrant_client = QdrantClient(
-            url=qdrant_url
+        self.qdrant_client = get_qdrant_client(
+            url=qdrant_url,
+            prefer_grpc=prefer_grpc
         )
         self.collection_name = collection_name
         self.threshold = threshold
 
+        # Local fallback index and the circuit breaker guarding Qdrant
+        self.local_index = None
+        local_index_dir = local_index_dir or os.getenv("LOCAL_INDEX_DIR", "local_index")
+        if os.path.isdir(local_index_dir):
+            self.local_index = LocalBM25Index.load(local_index_dir)
+        else:
+            logger.warning(f"Local index not found at {local_index_dir}, Qdrant fallback disabled")
+        self.circuit_breaker = CircuitBreaker(
+            name="qdrant",
+            error_rate_threshold=float(os.getenv("QDRANT_ERROR_RATE_THRESHOLD", "0.5")),
+            latency_threshold=float(os.getenv("QDRANT_LATENCY_THRESHOLD", "2.0")),
+            reset_timeout=float(os.getenv("QDRANT_RESET_TIMEOUT", "30"))
+        )
+
     def query(
         self,
         query: str,
     ) -> List[Dict[str, Any]]:
         """
         Perform a hybrid search using the provided query.
+        Falls back to the local BM25 index while the Qdrant circuit breaker is open
+        or when the Qdrant request fails. Only the Qdrant request is timed by the
+        breaker, query encoding errors are raised as before.
         Args:
             query (str): The search query.
         Returns:
             List[Dict[str, Any]]: List of documents matching the query.
         """
+        if self.local_index is None:
+            return self.format_documents(self.query_qdrant(self.build_prefetch(query)))
+
+        token = self.circuit_breaker.allow_request()
+        if token is None:
+            logger.warning("Qdrant circuit breaker is open, using local index")
+            return self.format_documents(self.query_local(query))
+
+        try:
+            prefetch = self.build_prefetch(query)
+        except Exception:
+            self.circuit_breaker.release(token)
+            raise
+
+        start = time.perf_counter()
+        try:
+            points = self.query_qdrant(prefetch)
+        except Exception as e:
+            self.circuit_breaker.record_failure(time.perf_counter() - start, token)
+            logger.error(f"Qdrant query failed, using local index: {e}")
+            return self.format_documents(self.query_local(query))
+
+        self.circuit_breaker.record_success(time.perf_counter() - start, token)
+        return self.format_documents(points)
+
+    def query_local(
+        self,
+        query: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search the local BM25 index.
+        Args:
+            query (str): The search query.
+        Returns:
+            List[Dict[str, Any]]: Payloads of the matching documents.
+        """
+        start = time.perf_counter()
+        results = self.local_index.search(query, limit=5)
+        logger.info(f"Local index search completed in {(time.perf_counter() - start) * 1000:.1f} ms")
+        return [doc for doc, _ in results]
+
+    def build_prefetch(
+        self,
+        query: str,
+    ) -> List[models.Prefetch]:
+        """
+        Encode the query into dense, BM25 and late interaction prefetch queries.
+        Args:
+            query (str): The search query.
+        Returns:
+            List[models.Prefetch]: Prefetch queries for the RRF fusion query.
+        """
 
         # Create dense embeddings
         dense_embeddings_query = self.dense_embedding_model.embeddings.create(
@@ -95,6 +171,19 @@ class HybridSearch:
             )
         ]
 
+        return prefetch
+
+    def query_qdrant(
+        self,
+        prefetch: List[models.Prefetch],
+    ) -> List[Dict[str, Any]]:
+        """
+        Search Qdrant with the prefetch queries fused by RRF.
+        Args:
+            prefetch (List[models.Prefetch]): Output of build_prefetch.
+        Returns:
+            List[Dict[str, Any]]: Payloads of the documents scoring above the threshold.
+        """
         responses = self.qdrant_client.query_points(
             collection_name=self.collection_name,
             prefetch=prefetch,
@@ -105,21 +194,35 @@ class HybridSearch:
             limit=5,
         )
 
+        return [
+            response.payload
+            for response in responses.points
+            if response.score >= self.threshold
+        ]
 
+    def format_documents(
+        self,
+        documents: List[Dict[str, Any]]
+    ) -> str:
+        """
+        Render document payloads for the system prompt.
+        Args:
+            documents (List[Dict[str, Any]]): Document payloads.
+        Returns:
+            str: Formatted documents.
+        """
         docs = ""
-        for i, response in enumerate(responses.points):
-            if response.score >= self.threshold:
-                doc = response.payload
-                docs += f"Document {i+1}:\n"
-                docs += f"Title: {doc.get('root_title', '')}\n"
-                docs += f"Summary: {doc.get('root_summary', '')}\n"
-                docs += f"Issue Date: {doc.get('root_issue_date', '')}\n"
-                docs += f"Effective Date: {doc.get('root_effective_date', '')}\n"
-                docs += f"Chapter Title: {doc.get('chapter_title', '')}\n"
-                docs += f"Chapter Summary: {doc.get('chapter_summary', '')}\n"
-                docs += f"Section Title: {doc.get('section_title', '')}\n"
-                docs += f"Section Summary: {doc.get('section_summary', '')}\n"
-                docs += f"Raw Articles: {doc.get('raw_articles', '')}\n\n"
+        for i, doc in enumerate(documents):
+            docs += f"Document {i+1}:\n"
+            docs += f"Title: {doc.get('root_title', '')}\n"
+            docs += f"Summary: {doc.get('root_summary', '')}\n"
+            docs += f"Issue Date: {doc.get('root_issue_date', '')}\n"
+            docs += f"Effective Date: {doc.get('root_effective_date', '')}\n"
+            docs += f"Chapter Title: {doc.get('chapter_title', '')}\n"
+            docs += f"Chapter Summary: {doc.get('chapter_summary', '')}\n"
+            docs += f"Section Title: {doc.get('section_title', '')}\n"
+            docs += f"Section Summary: {doc.get('section_summary', '')}\n"
+            docs += f"Raw Articles: {doc.get('raw_articles', '')}\n\n"
 
         return docs.strip() if docs else "No relevant documents found."
 
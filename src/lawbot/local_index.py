@@ -0,0 +1,229 @@
+import os
+import re
+import json
+from typing import List, Dict, Any, Tuple
+import numpy as np
+from loguru import logger
+from pyvi import ViTokenizer
+
+
+INDEXED_FIELDS = ["root_title", "chapter_title", "section_title", "article_summary", "raw_articles"]
+
+# Fields rendered by HybridSearch.format_documents, the only ones kept in the payload store
+PAYLOAD_FIELDS = [
+    "root_title", "root_summary", "root_issue_date", "root_effective_date",
+    "chapter_title", "chapter_summary", "section_title", "section_summary", "raw_articles"
+]
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Segment Vietnamese text into lower-cased word tokens with pyvi.
+    Compound words are kept as a single token joined by "_" (e.g. "hình_sự").
+    Args:
+        text (str): Raw text.
+    Returns:
+        List[str]: Word tokens without punctuation.
+    """
+    if not text:
+        return []
+    segmented = ViTokenizer.tokenize(text)
+    return [token.lower() for token in segmented.split() if _TOKEN_PATTERN.search(token)]
+
+
+class LocalBM25Index:
+    """
+    A compact in-process BM25 index stored as CSR-style NumPy arrays.
+
+    Files in the index directory:
+        vocab.json          term -> term id
+        term_offsets.npy    int64, postings of term t are [offsets[t], offsets[t + 1])
+        postings_docs.npy   int32, document ids
+        postings_tf.npy     float32, term frequencies
+        doc_lengths.npy     float32, number of tokens per document
+        idf.npy             float32, BM25 idf per term
+        payloads.npy        uint8, UTF-8 JSON payloads of all documents back to back
+        payload_offsets.npy int64, payload of document d is payloads[offsets[d]:offsets[d + 1]]
+
+    Every array is memory-mapped on load; payloads are only decoded for search hits.
+    """
+
+    def __init__(
+        self,
+        vocab: Dict[str, int],
+        term_offsets: np.ndarray,
+        postings_docs: np.ndarray,
+        postings_tf: np.ndarray,
+        doc_lengths: np.ndarray,
+        idf: np.ndarray,
+        payloads: np.ndarray,
+        payload_offsets: np.ndarray,
+        k1: float = 1.2,
+        b: float = 0.75
+    ) -> None:
+        self.vocab = vocab
+        self.term_offsets = term_offsets
+        self.postings_docs = postings_docs
+        self.postings_tf = postings_tf
+        self.doc_lengths = doc_lengths
+        self.idf = idf
+        self.payloads = payloads
+        self.payload_offsets = payload_offsets
+        self.k1 = k1
+        self.b = b
+
+        # Precompute the per-document length normalisation of the BM25 denominator
+        avg_doc_length = float(doc_lengths.mean()) if len(doc_lengths) else 1.0
+        self.length_norm = (k1 * (1 - b + b * doc_lengths / max(avg_doc_length, 1e-9))).astype(np.float32)
+
+    @staticmethod
+    def build(
+        documents: List[Dict[str, Any]],
+        index_dir: str
+    ) -> None:
+        """
+        Build the index from processed documents and write it to disk.
+        Args:
+            documents (List[Dict[str, Any]]): Processed documents (see DocumentLoader.postprocessing_documents).
+            index_dir (str): Output directory.
+        """
+        os.makedirs(index_dir, exist_ok=True)
+
+        vocab: Dict[str, int] = {}
+        term_postings: List[List[Tuple[int, int]]] = []
+        doc_lengths = np.zeros(len(documents), dtype=np.float32)
+
+        for doc_id, doc in enumerate(documents):
+            text = "\n".join(str(doc.get(field, "")) for field in INDEXED_FIELDS)
+            tokens = tokenize(text)
+            doc_lengths[doc_id] = len(tokens)
+
+            counts: Dict[str, int] = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+
+            for token, count in counts.items():
+                term_id = vocab.setdefault(token, len(vocab))
+                if term_id == len(term_postings):
+                    term_postings.append([])
+                term_postings[term_id].append((doc_id, count))
+
+        term_offsets = np.zeros(len(vocab) + 1, dtype=np.int64)
+        for term_id, postings in enumerate(term_postings):
+            term_offsets[term_id + 1] = term_offsets[term_id] + len(postings)
+
+        postings_docs = np.empty(term_offsets[-1], dtype=np.int32)
+        postings_tf = np.empty(term_offsets[-1], dtype=np.float32)
+        for term_id, postings in enumerate(term_postings):
+            start, end = term_offsets[term_id], term_offsets[term_id + 1]
+            postings_docs[start:end] = [doc_id for doc_id, _ in postings]
+            postings_tf[start:end] = [count for _, count in postings]
+
+        n_docs = len(documents)
+        doc_freq = np.diff(term_offsets).astype(np.float32)
+        idf = np.log(1 + (n_docs - doc_freq + 0.5) / (doc_freq + 0.5)).astype(np.float32)
+
+        np.save(os.path.join(index_dir, "term_offsets.npy"), term_offsets)
+        np.save(os.path.join(index_dir, "postings_docs.npy"), postings_docs)
+        np.save(os.path.join(index_dir, "postings_tf.npy"), postings_tf)
+        np.save(os.path.join(index_dir, "doc_lengths.npy"), doc_lengths)
+        np.save(os.path.join(index_dir, "idf.npy"), idf)
+
+        encoded = [
+            json.dumps({field: doc.get(field, "") for field in PAYLOAD_FIELDS}, ensure_ascii=False).encode("utf-8")
+            for doc in documents
+        ]
+        payload_offsets = np.zeros(n_docs + 1, dtype=np.int64)
+        payload_offsets[1:] = np.cumsum([len(payload) for payload in encoded])
+        np.save(os.path.join(index_dir, "payloads.npy"), np.frombuffer(b"".join(encoded), dtype=np.uint8))
+        np.save(os.path.join(index_dir, "payload_offsets.npy"), payload_offsets)
+
+        with open(os.path.join(index_dir, "vocab.json"), "w", encoding="utf-8") as f:
+            json.dump(vocab, f, ensure_ascii=False)
+
+        logger.info(
+            f"Local BM25 index built in {index_dir}: {n_docs} documents, "
+            f"{len(vocab)} terms, {len(postings_docs)} postings"
+        )
+
+    @classmethod
+    def load(
+        cls,
+        index_dir: str
+    ) -> "LocalBM25Index":
+        """
+        Load an index from disk, memory-mapping the postings and payloads.
+        Args:
+            index_dir (str): Directory written by LocalBM25Index.build.
+        Returns:
+            LocalBM25Index: Loaded index.
+        """
+        def load_array(name: str) -> np.ndarray:
+            return np.load(os.path.join(index_dir, f"{name}.npy"), mmap_mode="r")
+
+        with open(os.path.join(index_dir, "vocab.json"), "r", encoding="utf-8") as f:
+            vocab = json.load(f)
+
+        index = cls(
+            vocab=vocab,
+            term_offsets=load_array("term_offsets"),
+            postings_docs=load_array("postings_docs"),
+            postings_tf=load_array("postings_tf"),
+            doc_lengths=load_array("doc_lengths"),
+            idf=load_array("idf"),
+            payloads=load_array("payloads"),
+            payload_offsets=load_array("payload_offsets")
+        )
+        logger.info(f"Local BM25 index loaded from {index_dir}: {len(index)} documents")
+        return index
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def document(
+        self,
+        doc_id: int
+    ) -> Dict[str, Any]:
+        """
+        Decode the payload of one document.
+        Args:
+            doc_id (int): Document id.
+        Returns:
+            Dict[str, Any]: Payload with the PAYLOAD_FIELDS of the document.
+        """
+        start, end = self.payload_offsets[doc_id], self.payload_offsets[doc_id + 1]
+        return json.loads(self.payloads[start:end].tobytes().decode("utf-8"))
+
+    def search(
+        self,
+        query: str,
+        limit: int = 5
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Score every document containing a query term with BM25.
+        Args:
+            query (str): The search query.
+            limit (int): Number of documents to return.
+        Returns:
+            List[Tuple[Dict[str, Any], float]]: Documents and their scores, best first.
+        """
+        term_ids = {self.vocab[token] for token in tokenize(query) if token in self.vocab}
+        if not term_ids:
+            return []
+
+        scores = np.zeros(len(self), dtype=np.float32)
+        for term_id in term_ids:
+            start, end = self.term_offsets[term_id], self.term_offsets[term_id + 1]
+            doc_ids = self.postings_docs[start:end]
+            tf = self.postings_tf[start:end]
+            # Each document appears once per term, so fancy-index += is safe here
+            scores[doc_ids] += self.idf[term_id] * tf * (self.k1 + 1) / (tf + self.length_norm[doc_ids])
+
+        limit = min(limit, int(np.count_nonzero(scores)))
+        if limit == 0:
+            return []
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top])]
+        return [(self.document(doc_id), float(scores[doc_id])) for doc_id in top]
@@ -0,0 +1,85 @@
+import os
+import sys
+import threading
+from collections import Counter
+from typing import Optional
+from loguru import logger
+
+
+class StackSampler:
+    """
+    A sampling profiler that periodically records the Python stacks of all threads.
+
+    Only stacks passing through the focus function are kept, rooted at that
+    frame. The output is written in the folded ("collapsed") stack format, which
+    flamegraph.pl and https://www.speedscope.app render as flame graphs.
+    """
+
+    def __init__(
+        self,
+        output_path: str,
+        interval: float = 0.005,
+        focus_file: str = "chat_service.py",
+        focus_function: str = "chat"
+    ) -> None:
+        """
+        Initialize the sampler.
+        Args:
+            output_path (str): File the folded stacks are written to.
+            interval (float): Seconds between samples.
+            focus_file (str): File name of the function the flame graph is rooted at.
+            focus_function (str): Name of the function the flame graph is rooted at.
+        """
+        self.output_path = output_path
+        self.interval = interval
+        self.focus_file = focus_file
+        self.focus_function = focus_function
+
+        self._samples = Counter()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        Start sampling in a background thread.
+        """
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+        logger.info(f"Stack sampler started, writing to {self.output_path}")
+
+    def stop(self) -> None:
+        """
+        Stop sampling and write the folded stacks.
+        """
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.output_path)), exist_ok=True)
+        with open(self.output_path, "w", encoding="utf-8") as f:
+            for stack, count in self._samples.most_common():
+                f.write(f"{stack} {count}\n")
+        logger.info(f"Stack sampler wrote {sum(self._samples.values())} samples to {self.output_path}")
+
+    def _run(self) -> None:
+        own_thread_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread_id:
+                    continue
+                stack = self._focused_stack(frame)
+                if stack:
+                    self._samples[stack] += 1
+
+    def _focused_stack(self, frame) -> Optional[str]:
+        frames = []
+        while frame is not None:
+            code = frame.f_code
+            frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            if code.co_name == self.focus_function and code.co_filename.endswith(self.focus_file):
+                return ";".join(reversed(frames))
+            frame = frame.f_back
+        return None
@@ -1,13 +1,18 @@
 import os
+import sys
 import json
 import tqdm
-from typing import List, Dict, Any, Generator
+from typing import List, Dict, Any, Generator, Optional
 from loguru import logger
-import openai
-from qdrant_client import QdrantClient, models
+from qdrant_client import models
 from fastembed.sparse.bm25 import Bm25
 from fastembed.late_interaction import LateInteractionTextEmbedding
 
+# Share the client factory with the chat service
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lawbot"))
+from clients import get_openai_client, get_qdrant_client
+from local_index import LocalBM25Index
+
 
 os.environ["OPENAI_API_KEY"] = "your openai api key"  # Set your OpenAI API key
 
@@ -64,19 +69,19 @@ class QdrantUploader:
         sparse_model: str = "Qdrant/bm25",
         late_interaction_model: str = "colbert-ir/colbertv2.0",
         batch_size: int = 10,
-        document_path: str = "law_data/processed_documents.json"
+        document_path: str = "law_data/processed_documents.json",
+        prefer_grpc: Optional[bool] = None
     )-> None:
 
         # Initialize QdrantUploader with necessary configurations.
         self.collection_name = collection_name
-        self.qdrant_client = QdrantClient(
-            url=qdrant_url
+        self.qdrant_client = get_qdrant_client(
+            url=qdrant_url,
+            prefer_grpc=prefer_grpc
         )
 
         # OpenAI Embedding Configs
-        self.dense_embedding_model = openai.Client(
-            api_key=os.getenv("OPENAI_API_KEY"),
-        )
+        self.dense_embedding_model = get_openai_client()
         self.embedding_model = embedding_model
 
         # Sparse and Late Interaction Embedding Configs
@@ -198,6 +203,14 @@ class QdrantUploader:
             logger.error(f"Error uploading documents: {e}")
             raise e
 
+    def build_local_index(self, index_dir: str):
+        """
+        Build the local BM25 index the chat service falls back to when Qdrant is unavailable.
+        Args:
+            index_dir (str): Output directory, served to the chat service via LOCAL_INDEX_DIR.
+        """
+        LocalBM25Index.build(self.documents, index_dir)
+
 
 if __name__ == "__main__":
     # Example usage
@@ -207,3 +220,5 @@ if __name__ == "__main__":
         document_path="/Users/haonguyen/Documents/legal-retrieval-document-with-mlops/src/law_data/processed_documents.json"
     )
     uploader.upload_documents()
+    # Written next to chat_api.py so `COPY . .` in src/lawbot/Dockerfile picks it up
+    uploader.build_local_index(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lawbot", "local_index"))
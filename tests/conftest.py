@@ -0,0 +1,8 @@
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# The chat service and benchmark modules use flat imports (see src/lawbot/Dockerfile)
+sys.path.insert(0, os.path.join(SRC_DIR, "lawbot"))
+sys.path.insert(0, os.path.join(SRC_DIR, "benchmark"))
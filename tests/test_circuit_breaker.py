@@ -0,0 +1,136 @@
+import pytest
+
+pytest.importorskip("loguru")
+
+import circuit_breaker
+from circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", clock)
+    return clock
+
+
+def make_breaker(**kwargs) -> CircuitBreaker:
+    options = dict(window_size=10, min_calls=4, error_rate_threshold=0.5, latency_threshold=1.0, reset_timeout=30.0)
+    options.update(kwargs)
+    return CircuitBreaker(**options)
+
+
+def test_stays_closed_below_min_calls(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_failure(0.1, breaker.allow_request())
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request() == CircuitBreaker.NORMAL
+
+
+def test_opens_on_error_rate(clock):
+    breaker = make_breaker()
+    breaker.record_success(0.1, breaker.allow_request())
+    breaker.record_success(0.1, breaker.allow_request())
+    breaker.record_failure(0.1, breaker.allow_request())
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure(0.1, breaker.allow_request())
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow_request() is None
+
+
+def test_opens_on_mean_latency(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_success(0.5, breaker.allow_request())
+    breaker.record_success(2.5, breaker.allow_request())
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def open_breaker(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.min_calls):
+        breaker.record_failure(0.1, breaker.allow_request())
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_half_open_trial_success_closes(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+
+    clock.now += 29.0
+    assert breaker.allow_request() is None
+
+    clock.now += 1.0
+    token = breaker.allow_request()
+    assert token is not None
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # Only one trial at a time
+    assert breaker.allow_request() is None
+
+    breaker.record_success(0.1, token)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request() == CircuitBreaker.NORMAL
+
+
+def test_half_open_trial_failure_reopens(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+
+    clock.now += 30.0
+    token = breaker.allow_request()
+    breaker.record_failure(0.1, token)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow_request() is None
+
+    clock.now += 30.0
+    assert breaker.allow_request() is not None
+
+
+def test_half_open_slow_trial_reopens(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+
+    clock.now += 30.0
+    breaker.record_success(1.5, breaker.allow_request())
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_half_open_ignores_non_trial_results(clock):
+    breaker = make_breaker()
+    straggler = breaker.allow_request()
+    open_breaker(breaker)
+
+    clock.now += 30.0
+    token = breaker.allow_request()
+
+    # A request admitted before the breaker opened reports late
+    breaker.record_success(0.1, straggler)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.record_failure(5.0, straggler)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    breaker.record_success(0.1, token)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_release_frees_trial_slot(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+
+    clock.now += 30.0
+    token = breaker.allow_request()
+    assert breaker.allow_request() is None
+    breaker.release(token)
+
+    next_token = breaker.allow_request()
+    assert next_token is not None and next_token != token
+    breaker.record_success(0.1, token)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
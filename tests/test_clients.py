@@ -0,0 +1,86 @@
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("openai")
+pytest.importorskip("qdrant_client")
+
+import clients
+
+
+class RecordingQdrantClient:
+
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+
+
+@pytest.fixture(autouse=True)
+def isolated_clients(monkeypatch):
+    for name in (
+        "QDRANT_PATH", "QDRANT_PREFER_GRPC", "QDRANT_GRPC_PORT", "QDRANT_POOL_SIZE",
+        "QDRANT_GRPC_KEEPALIVE_MS", "QDRANT_KEEPALIVE_EXPIRY", "QDRANT_TIMEOUT",
+        "OPENAI_MAX_CONNECTIONS", "OPENAI_MAX_KEEPALIVE", "OPENAI_KEEPALIVE_EXPIRY",
+        "OPENAI_HTTP2", "OPENAI_TIMEOUT",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(clients, "QdrantClient", RecordingQdrantClient)
+    clients._build_qdrant_client.cache_clear()
+    clients._build_openai_client.cache_clear()
+    yield
+    clients._build_qdrant_client.cache_clear()
+    clients._build_openai_client.cache_clear()
+
+
+def test_one_qdrant_client_per_configuration():
+    client = clients.get_qdrant_client(url="http://qdrant:6333")
+    assert clients.get_qdrant_client(url="http://qdrant:6333") is client
+    assert clients.get_qdrant_client(url="http://qdrant:6333", prefer_grpc=True) is not client
+
+
+def test_explicit_zero_reaches_rest_limits(monkeypatch):
+    monkeypatch.setenv("QDRANT_POOL_SIZE", "50")
+    monkeypatch.setenv("QDRANT_KEEPALIVE_EXPIRY", "60")
+    client = clients.get_qdrant_client(url="http://qdrant:6333", pool_size=0, keepalive_expiry=0)
+    limits = client.kwargs["limits"]
+    assert limits.max_connections == 0
+    assert limits.keepalive_expiry == 0
+
+
+def test_grpc_and_rest_keepalive_are_separate(monkeypatch):
+    monkeypatch.setenv("QDRANT_GRPC_KEEPALIVE_MS", "5000")
+    monkeypatch.setenv("QDRANT_KEEPALIVE_EXPIRY", "7")
+    grpc = clients.get_qdrant_client(url="http://qdrant:6333", prefer_grpc=True)
+    rest = clients.get_qdrant_client(url="http://qdrant:6333", prefer_grpc=False)
+    assert grpc.kwargs["grpc_options"]["grpc.keepalive_time_ms"] == 5000
+    assert rest.kwargs["limits"].keepalive_expiry == 7
+
+
+def test_url_without_scheme_is_a_server():
+    client = clients.get_qdrant_client(url="localhost:6333")
+    assert client.kwargs["url"] == "localhost:6333"
+    assert "path" not in client.kwargs
+
+
+def test_memory_location():
+    client = clients.get_qdrant_client(url=":memory:")
+    assert client.kwargs == {"location": ":memory:"}
+
+
+def test_qdrant_path_overrides_url(monkeypatch, tmp_path):
+    monkeypatch.setenv("QDRANT_PATH", str(tmp_path))
+    client = clients.get_qdrant_client(url="http://qdrant:6333")
+    assert client.kwargs == {"path": str(tmp_path)}
+
+
+def test_one_openai_client_per_configuration():
+    client = clients.get_openai_client()
+    assert clients.get_openai_client() is client
+    assert clients.get_openai_client(max_connections=5) is not client
+
+
+def test_openai_client_keeps_sdk_http_defaults():
+    client = clients.get_openai_client(timeout=30, max_keepalive_connections=0)
+    http_client = client._client
+    assert http_client.follow_redirects is True
+    assert http_client.timeout.read == 30
+    assert http_client.timeout.connect == clients.openai.DEFAULT_TIMEOUT.connect
@@ -0,0 +1,53 @@
+import pytest
+
+openai = pytest.importorskip("openai")
+pytest.importorskip("fastapi")
+pytest.importorskip("uvicorn")
+
+from fastapi.testclient import TestClient
+
+from fake_openai import create_app
+
+
+@pytest.fixture
+def client():
+    app = create_app(ttft=0, token_latency=0, tokens=3, embedding_dim=8, embedding_latency=0)
+    return openai.OpenAI(
+        api_key="fake",
+        base_url="http://testserver/v1",
+        http_client=TestClient(app, base_url="http://testserver")
+    )
+
+
+def test_streamed_completion_parses_through_sdk(client):
+    stream = client.chat.completions.create(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "Xin chào"}],
+        stream=True
+    )
+    chunks = list(stream)
+
+    assert chunks[0].choices[0].delta.role == "assistant"
+    assert "".join(chunk.choices[0].delta.content or "" for chunk in chunks) == "token " * 3
+    assert chunks[-1].choices[0].finish_reason == "stop"
+    assert len({chunk.id for chunk in chunks}) == 1
+
+
+def test_completion_without_stream(client):
+    completion = client.chat.completions.create(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "Xin chào"}]
+    )
+
+    assert completion.choices[0].message.content == "token " * 3
+    assert completion.usage.completion_tokens == 3
+
+
+def test_embeddings_are_deterministic(client):
+    # The SDK requests base64 embeddings by default and decodes them to floats
+    first = client.embeddings.create(model="text-embedding-3-small", input=["luật", "hình sự"])
+    second = client.embeddings.create(model="text-embedding-3-small", input="luật")
+
+    assert [len(item.embedding) for item in first.data] == [8, 8]
+    assert first.data[0].embedding == pytest.approx(second.data[0].embedding)
+    assert first.data[0].embedding != pytest.approx(first.data[1].embedding)
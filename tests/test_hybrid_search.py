@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pyvi")
+pytest.importorskip("fastembed")
+pytest.importorskip("qdrant_client")
+
+# hybrid_search copies OPENAI_API_KEY into os.environ at import time
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+from circuit_breaker import CircuitBreaker
+from hybrid_search import HybridSearch
+from local_index import LocalBM25Index
+
+from test_local_index import DOCUMENTS
+
+
+class FailingQdrant:
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def query_points(self, **kwargs):
+        self.calls += 1
+        raise ConnectionError("qdrant unreachable")
+
+
+@pytest.fixture
+def searcher(tmp_path, monkeypatch):
+    LocalBM25Index.build(DOCUMENTS, str(tmp_path))
+
+    # Skip model loading, query encoding is not under test
+    searcher = HybridSearch.__new__(HybridSearch)
+    searcher.collection_name = "legal_documents"
+    searcher.threshold = 0.3
+    searcher.qdrant_client = FailingQdrant()
+    searcher.local_index = LocalBM25Index.load(str(tmp_path))
+    searcher.circuit_breaker = CircuitBreaker(min_calls=2, error_rate_threshold=0.5)
+    monkeypatch.setattr(searcher, "build_prefetch", lambda query: [])
+    return searcher
+
+
+def test_falls_back_when_query_points_raises(searcher):
+    result = searcher.query("Giết người có bị xử lý hình sự không?")
+    assert searcher.qdrant_client.calls == 1
+    assert result.startswith("Document 1:\nTitle: Bộ luật Hình sự")
+
+
+def test_open_breaker_skips_qdrant(searcher):
+    searcher.query("giết người")
+    searcher.query("giết người")
+    assert searcher.circuit_breaker.state == CircuitBreaker.OPEN
+
+    result = searcher.query("nghỉ phép năm")
+    assert searcher.qdrant_client.calls == 2
+    assert "Bộ luật Lao động" in result
+
+
+def test_encoding_error_is_not_counted_against_qdrant(searcher, monkeypatch):
+    def fail(query):
+        raise TimeoutError("embeddings timed out")
+
+    monkeypatch.setattr(searcher, "build_prefetch", fail)
+    for _ in range(3):
+        with pytest.raises(TimeoutError):
+            searcher.query("giết người")
+    assert searcher.circuit_breaker.state == CircuitBreaker.CLOSED
+    assert searcher.qdrant_client.calls == 0
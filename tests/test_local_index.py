@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pyvi")
+
+from local_index import PAYLOAD_FIELDS, LocalBM25Index, tokenize
+
+
+DOCUMENTS = [
+    {
+        "root_title": "Bộ luật Hình sự",
+        "article_summary": "Người phạm tội giết người bị xử lý hình sự, phạt tù từ 12 năm đến 20 năm",
+        "raw_articles": "Điều 123. Tội giết người"
+    },
+    {
+        "root_title": "Luật Giao thông đường bộ",
+        "article_summary": "Người điều khiển xe vượt đèn đỏ bị phạt tiền",
+        "raw_articles": "Điều 5. Các hành vi bị nghiêm cấm"
+    },
+    {
+        "root_title": "Bộ luật Lao động",
+        "article_summary": "Người lao động được nghỉ phép năm hưởng nguyên lương",
+        "raw_articles": "Điều 113. Nghỉ hằng năm"
+    },
+    {
+        "root_title": "Luật Đất đai",
+        "article_summary": "Thời hạn sử dụng đất nông nghiệp là 50 năm",
+        "raw_articles": "Điều 172. Đất sử dụng có thời hạn"
+    },
+]
+
+
+@pytest.fixture(scope="module")
+def index(tmp_path_factory):
+    index_dir = str(tmp_path_factory.mktemp("local_index"))
+    LocalBM25Index.build(DOCUMENTS, index_dir)
+    return LocalBM25Index.load(index_dir)
+
+
+def test_tokenize_segments_compound_words():
+    tokens = tokenize("Giết người có bị xử lý hình sự không?")
+    assert "hình_sự" in tokens
+    assert "?" not in tokens
+
+
+def test_round_trip_keeps_rendered_fields(index):
+    assert len(index) == len(DOCUMENTS)
+    for doc_id, doc in enumerate(DOCUMENTS):
+        assert index.document(doc_id) == {field: doc.get(field, "") for field in PAYLOAD_FIELDS}
+    assert "article_summary" not in index.document(0)
+
+
+def test_load_does_not_parse_payloads(tmp_path):
+    LocalBM25Index.build(DOCUMENTS, str(tmp_path))
+
+    # Corrupt the payload of a document the query below does not match
+    offsets = np.load(os.path.join(tmp_path, "payload_offsets.npy"))
+    payloads = np.load(os.path.join(tmp_path, "payloads.npy"), mmap_mode="r+")
+    payloads[offsets[3]:offsets[4]] = ord("#")
+    payloads.flush()
+    del payloads
+
+    index = LocalBM25Index.load(str(tmp_path))
+    assert isinstance(index.payloads, np.memmap)
+    assert isinstance(index.postings_docs, np.memmap)
+
+    results = index.search("giết người", limit=1)
+    assert results[0][0]["root_title"] == "Bộ luật Hình sự"
+    with pytest.raises(ValueError):
+        index.document(3)
+
+
+def test_ranks_matching_document_first(index):
+    results = index.search("Giết người có bị xử lý hình sự không?")
+    assert results[0][0]["root_title"] == "Bộ luật Hình sự"
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+    assert all(score > 0 for score in scores)
+
+
+def test_out_of_vocabulary_query_returns_nothing(index):
+    assert index.search("blockchain cryptocurrency") == []
+    assert index.search("") == []
+
+
+def test_limit_is_capped_by_matching_documents(index):
+    results = index.search("đất nông nghiệp", limit=10)
+    assert [doc["root_title"] for doc, _ in results] == ["Luật Đất đai"]
+    assert len(index.search("người", limit=2)) == 2
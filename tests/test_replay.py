@@ -0,0 +1,47 @@
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("loguru")
+
+from replay import summarize
+
+
+def test_summarize_skips_failed_requests():
+    results = [
+        {"ok": True, "ttft": 0.1, "latency": 1.0, "chars": 100},
+        {"ok": True, "ttft": 0.3, "latency": 2.0, "chars": 300},
+        {"ok": False, "ttft": 0.05, "latency": 9.0, "chars": 10},
+        {"ok": False, "ttft": None, "latency": 0.01, "chars": 0},
+    ]
+    summary = summarize(results, elapsed=2.0)
+
+    assert summary["requests"] == 4
+    assert summary["errors"] == 2
+    assert summary["throughput_rps"] == 1.0
+    assert summary["chars_per_s"] == 200.0
+    assert summary["latency_ms_p50"] == 1000.0
+    assert summary["latency_ms_max"] == 2000.0
+    assert summary["ttft_ms_p99"] == pytest.approx(300.0)
+
+
+def test_summarize_ignores_missing_ttft():
+    # A successful stream with an empty body never records a first token
+    results = [
+        {"ok": True, "ttft": None, "latency": 0.5, "chars": 0},
+        {"ok": True, "ttft": 0.2, "latency": 0.6, "chars": 50},
+    ]
+    summary = summarize(results, elapsed=1.0)
+
+    assert summary["errors"] == 0
+    assert summary["ttft_ms_p50"] == pytest.approx(200.0)
+    assert summary["ttft_ms_max"] == pytest.approx(200.0)
+    assert summary["latency_ms_p50"] == 500.0
+
+
+def test_summarize_all_failed():
+    summary = summarize([{"ok": False, "ttft": None, "latency": 1.0, "chars": 0}], elapsed=1.0)
+
+    assert summary["errors"] == 1
+    assert summary["throughput_rps"] == 0.0
+    assert summary["ttft_ms_p95"] == 0.0
+    assert summary["latency_ms_max"] == 0.0
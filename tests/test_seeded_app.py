@@ -0,0 +1,18 @@
+import importlib
+import sys
+
+import pytest
+
+pytest.importorskip("loguru")
+
+
+def test_seeding_requires_explicit_qdrant(monkeypatch):
+    monkeypatch.setenv("SEED_DOCUMENTS", "processed_documents.json")
+    monkeypatch.delenv("QDRANT_URL", raising=False)
+    monkeypatch.delenv("QDRANT_PATH", raising=False)
+    monkeypatch.delitem(sys.modules, "seeded_app", raising=False)
+
+    # Raised before chat_api is imported, so no Qdrant or model is touched
+    with pytest.raises(RuntimeError, match="QDRANT_URL or QDRANT_PATH"):
+        importlib.import_module("seeded_app")
+    assert "chat_api" not in sys.modules
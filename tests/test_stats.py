@@ -0,0 +1,28 @@
+from stats import percentile
+
+
+def test_empty_is_zero():
+    assert percentile([], 50) == 0.0
+
+
+def test_single_sample():
+    for q in (0, 50, 99, 100):
+        assert percentile([7.0], q) == 7.0
+
+
+def test_bounds_are_min_and_max():
+    values = [5.0, 1.0, 4.0, 2.0, 3.0]
+    assert percentile(values, 0) == 1.0
+    assert percentile(values, 100) == 5.0
+
+
+def test_median_of_even_count_is_lower_sample():
+    # Nearest rank never interpolates: p50 of 4 samples is the 2nd smallest
+    assert percentile([4.0, 1.0, 3.0, 2.0], 50) == 2.0
+
+
+def test_tail_percentiles():
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 90) == 90.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 99.5) == 100.0